@@ -3,14 +3,16 @@
 
 """Factory functions for all openvino ops."""
 from functools import partial
-from typing import List, Optional, Tuple
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 from openvino.runtime.exceptions import UserInputError
-from openvino.runtime import Node
+from openvino.runtime import Node, Output
+from openvino.runtime.opset1.ops import convert
 from openvino.runtime.opset_utils import _get_node_factory
 from openvino.runtime.utils.decorators import nameable_op
 from openvino.runtime.utils.input_validation import (
+    check_non_negative_ints,
     check_valid_attributes,
     is_non_negative_value,
     is_positive_value,
@@ -22,13 +24,65 @@ from openvino.runtime.utils.tensor_iterator_types import (
 )
 from openvino.runtime.utils.types import (
     NodeInput,
+    NumericType,
     TensorShape,
     as_node,
     as_nodes,
+    make_constant_node,
 )
 
 _get_node_factory_opset8 = partial(_get_node_factory, "opset8")
 
+# Shared by all factory functions below, so creating an op does not construct a new NodeFactory.
+_FACTORY = _get_node_factory_opset8()
+
+# Upper-case spellings of the pooling enum attributes, so max_pool does not call str.upper on the
+# usual values. None selects explicit padding.
+_ROUNDING_TYPES = {
+    "floor": "FLOOR",
+    "ceil": "CEIL",
+    "FLOOR": "FLOOR",
+    "CEIL": "CEIL",
+}
+_AUTO_PAD_TYPES = {
+    None: "EXPLICIT",
+    "explicit": "EXPLICIT",
+    "same_upper": "SAME_UPPER",
+    "same_lower": "SAME_LOWER",
+    "valid": "VALID",
+    "EXPLICIT": "EXPLICIT",
+    "SAME_UPPER": "SAME_UPPER",
+    "SAME_LOWER": "SAME_LOWER",
+    "VALID": "VALID",
+}
+
+# Numpy types of the random_uniform output types, used to create min_val and max_val constants
+# with the element type required by the op.
+_RANDOM_UNIFORM_NUMPY_TYPES = {
+    "f16": np.float16,
+    "f32": np.float32,
+    "f64": np.float64,
+    "i32": np.int32,
+    "i64": np.int64,
+}
+
+# Invariant attribute requirements checked by prior_box.
+_PRIOR_BOX_REQUIREMENTS = [
+    ("offset", True, np.floating, is_non_negative_value),
+    ("min_size", False, np.floating, is_positive_value),
+    ("max_size", False, np.floating, is_positive_value),
+    ("aspect_ratio", False, np.floating, is_positive_value),
+    ("flip", False, np.bool_, None),
+    ("clip", False, np.bool_, None),
+    ("step", False, np.floating, is_non_negative_value),
+    ("variance", False, np.floating, is_positive_value),
+    ("scale_all_sizes", False, np.bool_, None),
+    ("fixed_ratio", False, np.floating, is_positive_value),
+    ("fixed_size", False, np.floating, is_positive_value),
+    ("density", False, np.floating, is_positive_value),
+    ("min_max_aspect_ratios_order", False, np.bool_, None),
+]
+
 
 # -------------------------------------------- ops ------------------------------------------------
 
@@ -68,12 +122,10 @@ def deformable_convolution(
     @param name: The optional new name for output node.
     @return New node performing deformable convolution operation.
     """
-    if mask is None:
-        inputs = as_nodes(data, offsets, filters)
-    else:
-        inputs = as_nodes(data, offsets, filters, mask)
+    args = (data, offsets, filters) if mask is None else (data, offsets, filters, mask)
+    inputs = [arg if isinstance(arg, Node) else as_node(arg) for arg in args]
 
-    return _get_node_factory_opset8().create(
+    return _FACTORY.create(
         "DeformableConvolution",
         inputs,
         {
@@ -100,8 +152,8 @@ def adaptive_avg_pool(
     @param output_shape: the shape of spatial dimentions after operation
     @return: The new node performing AdaptiveAvgPool operation on the data
     """
-    inputs = as_nodes(data, output_shape)
-    return _get_node_factory_opset8().create("AdaptiveAvgPool", inputs)
+    inputs = [as_node(data), as_node(output_shape)]
+    return _FACTORY.create("AdaptiveAvgPool", inputs)
 
 
 @nameable_op
@@ -117,13 +169,13 @@ def adaptive_max_pool(
     @param index_element_type: Type of indices output.
     @return: The new node performing AdaptiveMaxPool operation on the data
     """
-    inputs = as_nodes(data, output_shape)
+    inputs = [as_node(data), as_node(output_shape)]
 
     attributes = {
         "index_element_type": index_element_type,
     }
 
-    return _get_node_factory_opset8().create("AdaptiveMaxPool", inputs, attributes)
+    return _FACTORY.create("AdaptiveMaxPool", inputs, attributes)
 
 
 @nameable_op
@@ -176,10 +228,10 @@ def multiclass_nms(
         "keep_top_k": keep_top_k,
         "background_class": background_class,
         "nms_eta": nms_eta,
-        "normalized": normalized
+        "normalized": normalized,
     }
 
-    return _get_node_factory_opset8().create("MulticlassNms", inputs, attributes)
+    return _FACTORY.create("MulticlassNms", inputs, attributes)
 
 
 @nameable_op
@@ -237,10 +289,10 @@ def matrix_nms(
         "decay_function": decay_function,
         "gaussian_sigma": gaussian_sigma,
         "post_threshold": post_threshold,
-        "normalized": normalized
+        "normalized": normalized,
     }
 
-    return _get_node_factory_opset8().create("MatrixNms", inputs, attributes)
+    return _FACTORY.create("MatrixNms", inputs, attributes)
 
 
 @nameable_op
@@ -263,7 +315,32 @@ def gather(
     attributes = {
         "batch_dims": batch_dims
     }
-    return _get_node_factory_opset8().create("Gather", inputs, attributes)
+    return _FACTORY.create("Gather", inputs, attributes)
+
+
+@nameable_op
+def gather_cast(
+        data: NodeInput,
+        indices: NodeInput,
+        axis: NodeInput,
+        destination_type: Union[str, NumericType],
+        batch_dims: Optional[int] = 0,
+        name: Optional[str] = None,
+) -> Node:
+    """Return a node which performs Gather and converts the gathered values to another type.
+
+    @param data:             N-D tensor with data for gathering
+    @param indices:          N-D tensor with indices by which data is gathered. Negative indices
+    indicate reverse indexing from the end
+    @param axis:             axis along which elements are gathered
+    @param destination_type: the element type of the output
+    @param batch_dims:       number of batch dimensions
+    @param name:             The optional name for the created output node.
+    @return:                 The new Convert node consuming the output of the Gather node
+    """
+    inputs = as_nodes(data, indices, axis)
+    gathered = _FACTORY.create("Gather", inputs, {"batch_dims": batch_dims})
+    return convert(gathered.output(0), destination_type)
 
 
 @nameable_op
@@ -302,9 +379,14 @@ def max_pool(
 
     @return   The new node performing max pooling operation.
     """
-    if auto_pad is None:
-        auto_pad = "explicit"
-    return _get_node_factory_opset8().create(
+    check_non_negative_ints("MaxPool", "strides", strides)
+    check_non_negative_ints("MaxPool", "dilations", dilations)
+    check_non_negative_ints("MaxPool", "pads_begin", pads_begin)
+    check_non_negative_ints("MaxPool", "pads_end", pads_end)
+    check_non_negative_ints("MaxPool", "kernel", kernel_shape)
+    rounding_type = _ROUNDING_TYPES.get(rounding_type) or rounding_type.upper()
+    auto_pad = _AUTO_PAD_TYPES.get(auto_pad) or auto_pad.upper()  # type: ignore
+    return _FACTORY.create(
         "MaxPool",
         [as_node(data)],
         {
@@ -313,8 +395,8 @@ def max_pool(
             "pads_begin": pads_begin,
             "pads_end": pads_end,
             "kernel": kernel_shape,
-            "rounding_type": rounding_type.upper(),
-            "auto_pad": auto_pad.upper(),
+            "rounding_type": rounding_type,
+            "auto_pad": auto_pad,
             "index_element_type": index_element_type,
             "axis": axis,
         },
@@ -334,27 +416,36 @@ def random_uniform(
 
     @param output_shape: Tensor with shape of the output tensor.
     @param min_val: Tensor with the lower bound on the range of random values to generate.
+                    Values which are not nodes are converted to constants of output_type.
     @param max_val: Tensor with the upper bound on the range of random values to generate.
+                    Values which are not nodes are converted to constants of output_type.
     @param output_type: Specifies the output tensor type, possible values:
     'i64', 'i32', 'f64', 'f32', 'f16', 'bf16'.
     @param global_seed: Specifies global seed value. Required to be a positive integer or 0.
     @param op_seed: Specifies operational seed value. Required to be a positive integer or 0.
     @return The new node which performs generation of random values from uniform distribution.
     """
-    inputs = as_nodes(output_shape, min_val, max_val)
+    if global_seed < 0 or op_seed < 0:
+        raise RuntimeError(
+            "global_seed and op_seed should be positive or 0. "
+            f"Got: global_seed={global_seed}, op_seed={op_seed}"
+        )
 
-    if global_seed < 0:
-        raise RuntimeError("global_seed should be positive or 0. Got: {}".format(global_seed))
+    bounds_type = _RANDOM_UNIFORM_NUMPY_TYPES.get(output_type)
+    if bounds_type is not None:
+        if not isinstance(min_val, (Node, Output)):
+            min_val = make_constant_node(min_val, bounds_type)
+        if not isinstance(max_val, (Node, Output)):
+            max_val = make_constant_node(max_val, bounds_type)
 
-    if op_seed < 0:
-        raise RuntimeError("op_seed should be positive or 0. Got: {}".format(op_seed))
+    inputs = as_nodes(output_shape, min_val, max_val)
 
     attributes = {
         "output_type": output_type,
         "global_seed": global_seed,
         "op_seed": op_seed,
     }
-    return _get_node_factory_opset8().create("RandomUniform", inputs, attributes)
+    return _FACTORY.create("RandomUniform", inputs, attributes)
 
 
 @nameable_op
@@ -381,16 +472,20 @@ def if_op(
 
     @return: The new node which performs If operation.
     """
+    then_body, else_body = bodies
+    then_inputs, else_inputs = input_desc
+    then_outputs, else_outputs = output_desc
+
     attributes = {
-        "then_body": bodies[0].serialize(),
-        "else_body": bodies[1].serialize(),
-        "then_inputs": {"invariant_input_desc": [desc.serialize() for desc in input_desc[0]]},
-        "else_inputs": {"invariant_input_desc": [desc.serialize() for desc in input_desc[1]]},
-        "then_outputs": {"body_output_desc": [desc.serialize() for desc in output_desc[0]]},
-        "else_outputs": {"body_output_desc": [desc.serialize() for desc in output_desc[1]]}
+        "then_body": then_body.serialize(),
+        "else_body": else_body.serialize(),
+        "then_inputs": {"invariant_input_desc": [desc.serialize() for desc in then_inputs]},
+        "else_inputs": {"invariant_input_desc": [desc.serialize() for desc in else_inputs]},
+        "then_outputs": {"body_output_desc": [desc.serialize() for desc in then_outputs]},
+        "else_outputs": {"body_output_desc": [desc.serialize() for desc in else_outputs]}
     }
-    return _get_node_factory_opset8().create("If", as_nodes(condition, *inputs),
-                                             attributes)
+    if_inputs = [arg if isinstance(arg, Node) else as_node(arg) for arg in (condition, *inputs)]
+    return _FACTORY.create("If", if_inputs, attributes)
 
 
 @nameable_op
@@ -412,12 +507,10 @@ def slice(
     @param  name: The optional name for the created output node.
     @return The new node performing Slice operation.
     """
-    if axes is None:
-        inputs = as_nodes(data, start, stop, step)
-    else:
-        inputs = as_nodes(data, start, stop, step, axes)
+    args = (data, start, stop, step) if axes is None else (data, start, stop, step, axes)
+    inputs = [arg if isinstance(arg, Node) else as_node(arg) for arg in args]
 
-    return _get_node_factory_opset8().create("Slice", inputs)
+    return _FACTORY.create("Slice", inputs)
 
 
 @nameable_op
@@ -434,13 +527,13 @@ def gather_nd(
     @param batch_dims: Scalar value of batch dimensions
     @return: The new node which performs GatherND
     """
-    inputs = as_nodes(data, indices)
+    inputs = [as_node(data), as_node(indices)]
 
     attributes = {
         "batch_dims": batch_dims
     }
 
-    return _get_node_factory_opset8().create("GatherND", inputs, attributes)
+    return _FACTORY.create("GatherND", inputs, attributes)
 
 
 @nameable_op
@@ -528,25 +621,36 @@ def prior_box(
     @endcode
     Optional attributes which are absent from dictionary will be set with corresponding default.
     """
-    requirements = [
-        ("offset", True, np.floating, is_non_negative_value),
-        ("min_size", False, np.floating, is_positive_value),
-        ("max_size", False, np.floating, is_positive_value),
-        ("aspect_ratio", False, np.floating, is_positive_value),
-        ("flip", False, np.bool_, None),
-        ("clip", False, np.bool_, None),
-        ("step", False, np.floating, is_non_negative_value),
-        ("variance", False, np.floating, is_positive_value),
-        ("scale_all_sizes", False, np.bool_, None),
-        ("fixed_ratio", False, np.floating, is_positive_value),
-        ("fixed_size", False, np.floating, is_positive_value),
-        ("density", False, np.floating, is_positive_value),
-        ("min_max_aspect_ratios_order", False, np.bool_, None),
-    ]
+    check_valid_attributes("PriorBox", attrs, _PRIOR_BOX_REQUIREMENTS)
 
-    check_valid_attributes("PriorBox", attrs, requirements)
+    return _FACTORY.create("PriorBox", [layer_shape, as_node(image_shape)], attrs)
+
+
+def prior_box_batch(
+        layer_shapes: List[Node], image_shape: NodeInput, attrs: List[dict]
+) -> List[Node]:
+    """Generate prior boxes for several layers scaled to the same image.
+
+    The image shape is converted to a node once and shared by all created PriorBox nodes.
+    See prior_box for the available attributes.
+
+    @param  layer_shapes:  Shapes of layers for which prior boxes are computed.
+    @param  image_shape:   Shape of image to which prior boxes are scaled.
+    @param  attrs:         The dictionaries with attributes, one per layer shape.
+    @return The list of nodes representing prior box operations, in the order of layer_shapes.
+    """
+    if len(layer_shapes) != len(attrs):
+        raise UserInputError(
+            "prior_box_batch expects one attributes dictionary per layer shape, got {} and {}.".format(
+                len(layer_shapes), len(attrs))
+        )
 
-    return _get_node_factory_opset8().create("PriorBox", [layer_shape, as_node(image_shape)], attrs)
+    image_shape_node = as_node(image_shape)
+    nodes = []
+    for layer_shape, layer_attrs in zip(layer_shapes, attrs):
+        check_valid_attributes("PriorBox", layer_attrs, _PRIOR_BOX_REQUIREMENTS)
+        nodes.append(_FACTORY.create("PriorBox", [layer_shape, image_shape_node], layer_attrs))
+    return nodes
 
 
 @nameable_op
@@ -565,15 +669,15 @@ def i420_to_bgr(
     @return The new node performing I420toBGR operation.
     """
     if arg_u is None and arg_v is None:
-        inputs = as_nodes(arg)
+        inputs = [as_node(arg)]
     elif arg_u is not None and arg_v is not None:
-        inputs = as_nodes(arg, arg_u, arg_v)
+        inputs = [as_node(arg), as_node(arg_u), as_node(arg_v)]
     else:
         raise UserInputError(
             "Operation I420toBGR must have one (single plane) or three (separate planes) inputs provided."
         )
 
-    return _get_node_factory_opset8().create("I420toBGR", inputs)
+    return _FACTORY.create("I420toBGR", inputs)
 
 
 @nameable_op
@@ -592,15 +696,15 @@ def i420_to_rgb(
     @return The new node performing I420toRGB operation.
     """
     if arg_u is None and arg_v is None:
-        inputs = as_nodes(arg)
+        inputs = [as_node(arg)]
     elif arg_u is not None and arg_v is not None:
-        inputs = as_nodes(arg, arg_u, arg_v)
+        inputs = [as_node(arg), as_node(arg_u), as_node(arg_v)]
     else:
         raise UserInputError(
             "Operation I420toRGB must have one (single plane) or three (separate planes) inputs provided."
         )
 
-    return _get_node_factory_opset8().create("I420toRGB", inputs)
+    return _FACTORY.create("I420toRGB", inputs)
 
 
 @nameable_op
@@ -617,11 +721,11 @@ def nv12_to_bgr(
     @return The new node performing NV12toBGR operation.
     """
     if arg_uv is None:
-        inputs = as_nodes(arg)
+        inputs = [as_node(arg)]
     else:
-        inputs = as_nodes(arg, arg_uv)
+        inputs = [as_node(arg), as_node(arg_uv)]
 
-    return _get_node_factory_opset8().create("NV12toBGR", inputs)
+    return _FACTORY.create("NV12toBGR", inputs)
 
 
 @nameable_op
@@ -638,11 +742,11 @@ def nv12_to_rgb(
     @return The new node performing NV12toRGB operation.
     """
     if arg_uv is None:
-        inputs = as_nodes(arg)
+        inputs = [as_node(arg)]
     else:
-        inputs = as_nodes(arg, arg_uv)
+        inputs = [as_node(arg), as_node(arg_uv)]
 
-    return _get_node_factory_opset8().create("NV12toRGB", inputs)
+    return _FACTORY.create("NV12toRGB", inputs)
 
 
 @nameable_op
@@ -777,4 +881,4 @@ def detection_output(
         inputs.append(aux_box_preds)
     inputs = as_nodes(*inputs)
 
-    return _get_node_factory_opset8().create("DetectionOutput", inputs, attrs)
+    return _FACTORY.create("DetectionOutput", inputs, attrs)
@@ -0,0 +1,51 @@
+# Copyright (C) 2018-2021 Intel Corporation
+# SPDX-License-Identifier: Apache-2.0
+
+"""Helpers for preparing DeformableConvolution offsets with numpy."""
+
+from typing import Tuple
+
+import numpy as np
+
+from openvino.runtime.exceptions import UserInputError
+
+
+def prepare_deformable_offsets(
+        offsets: np.ndarray, kernel_h: int, kernel_w: int
+) -> Tuple[np.ndarray, ...]:
+    """Split deformable convolution offsets into integer positions and bilinear weights.
+
+    Works on whole arrays at once, so preparing offsets in Python does not loop per element.
+
+    @param offsets:  Offsets tensor of shape [N, deformable_group * kernel_h * kernel_w * 2, H, W]
+                     holding (y, x) offset pairs, as consumed by deformable_convolution.
+    @param kernel_h: The filter height.
+    @param kernel_w: The filter width.
+    @return Tuple (y0, x0, w00, w01, w10, w11) of arrays shaped
+            [N, deformable_group, kernel_h, kernel_w, H, W]. y0 and x0 are the floor of the (y, x)
+            offsets themselves, not absolute sampling positions: the kernel tap position, stride,
+            padding and dilation still have to be added to get the sampled location. w00, w01, w10
+            and w11 are the bilinear weights of the top-left, top-right, bottom-left and
+            bottom-right neighbours of the offset point.
+    """
+    offsets = np.asarray(offsets, dtype=np.float32)
+    batch, channels, height, width = offsets.shape
+    if channels % (kernel_h * kernel_w * 2) != 0:
+        raise UserInputError(
+            "Offsets channel dimension {} is not divisible by kernel_h * kernel_w * 2 = {}.".format(
+                channels, kernel_h * kernel_w * 2)
+        )
+    offsets = offsets.reshape(batch, -1, kernel_h, kernel_w, 2, height, width)
+    offset_y = offsets[:, :, :, :, 0]
+    offset_x = offsets[:, :, :, :, 1]
+
+    y0 = np.floor(offset_y)
+    x0 = np.floor(offset_x)
+    dy = offset_y - y0
+    dx = offset_x - x0
+
+    w00 = (1 - dy) * (1 - dx)
+    w01 = (1 - dy) * dx
+    w10 = dy * (1 - dx)
+    w11 = dy * dx
+    return y0.astype(np.int64), x0.astype(np.int64), w00, w01, w10, w11
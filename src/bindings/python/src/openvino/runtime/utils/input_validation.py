@@ -116,6 +116,22 @@ def check_valid_attributes(
     return True
 
 
+def check_non_negative_ints(op_name, attr_key, values):
+    # type: (str, str, Iterable[int]) -> None
+    """Check that all values of a list attribute, like strides or kernel shape, are non-negative.
+
+    @param  op_name:    The operator name which attributes are checked.
+    @param  attr_key:   The attribute name.
+    @param  values:     The list of integer values to check.
+
+    :raises     UserInputError:
+    """
+    if any(value < 0 for value in values):
+        raise UserInputError(
+            '{} operator attribute "{}" values must be non-negative.'.format(op_name, attr_key)
+        )
+
+
 def is_positive_value(x):  # type: (Any) -> bool
     """Determine whether the specified x is positive value.
 
@@ -9,6 +9,9 @@ from openvino.runtime.exceptions import UserInputError
 import openvino.runtime.opset8 as ov
 import openvino.runtime.opset1 as ov_opset1
 import openvino.runtime.opset5 as ov_opset5
+from openvino.runtime.opset8.ops import prior_box_batch
+from openvino.runtime.utils.deformable_offsets import prepare_deformable_offsets
+from tests.runtime import get_runtime
 from openvino.runtime import Type
 
 np_types = [np.float32, np.int32]
@@ -210,6 +213,24 @@ def test_deformable_convolution_mask(dtype):
     assert list(node.get_output_shape(0)) == expected_shape
 
 
+def test_prepare_deformable_offsets():
+    offsets = np.zeros([1, 18, 2, 2], dtype=np.float32)
+    offsets[0, 0] = -1.25
+    offsets[0, 1] = 0.5
+
+    y0, x0, w00, w01, w10, w11 = prepare_deformable_offsets(offsets, 3, 3)
+
+    assert y0.shape == (1, 1, 3, 3, 2, 2)
+    assert np.all(y0[0, 0, 0, 0] == -2)
+    assert np.all(x0[0, 0, 0, 0] == 0)
+    assert np.allclose(w00[0, 0, 0, 0], 0.125)
+    assert np.allclose(w01[0, 0, 0, 0], 0.125)
+    assert np.allclose(w10[0, 0, 0, 0], 0.375)
+    assert np.allclose(w11[0, 0, 0, 0], 0.375)
+    assert np.allclose(w00 + w01 + w10 + w11, 1)
+    assert np.allclose(w00[0, 0, 1:, :], 1)
+
+
 @pytest.mark.parametrize("dtype", np_types)
 def test_deformable_psroi_pooling(dtype):
     output_dim = 8
@@ -1061,6 +1082,29 @@ def test_prior_box(int_dtype, fp_dtype):
     assert list(node.get_output_shape(0)) == [2, 20480]
 
 
+def test_prior_box_batch():
+    image_shape = np.array([64, 64], dtype=np.int64)
+    attributes = [
+        {"offset": np.float32(0), "min_size": np.array([2, 3], dtype=np.float32)},
+        {"offset": np.float32(0.5), "min_size": np.array([4], dtype=np.float32)},
+    ]
+    layer_shapes = [
+        ov.constant(np.array([32, 32], dtype=np.int64), np.int64),
+        ov.constant(np.array([16, 16], dtype=np.int64), np.int64),
+    ]
+
+    nodes = prior_box_batch(layer_shapes, image_shape, attributes)
+
+    assert [node.get_type_name() for node in nodes] == ["PriorBox", "PriorBox"]
+    assert list(nodes[0].get_output_shape(0)) == [2, 8192]
+    assert list(nodes[1].get_output_shape(0)) == [2, 1024]
+    image_shape_names = [node.input_value(1).get_node().get_friendly_name() for node in nodes]
+    assert image_shape_names[0] == image_shape_names[1]
+
+    with pytest.raises(UserInputError):
+        prior_box_batch(layer_shapes, image_shape, attributes[:1])
+
+
 @pytest.mark.parametrize(
     "int_dtype, fp_dtype",
     [
@@ -2028,3 +2072,66 @@ def test_nv12_to_rgb():
     assert node_separate_planes.get_output_size() == 1
     assert node_separate_planes.get_output_element_type(0) == Type.f32
     assert list(node_separate_planes.get_output_shape(0)) == expected_output_shape
+
+
+def yuv_to_rgb_numpy(y, u, v, bgr=False):
+    # Same coefficients and rounding as the reference NV12/I420 color conversion kernels.
+    c = y.astype(np.float32) - 16
+    d = u.astype(np.float32) - 128
+    e = v.astype(np.float32) - 128
+
+    r = 1.164 * c + 1.596 * e
+    g = 1.164 * c - 0.391 * d - 0.813 * e
+    b = 1.164 * c + 2.018 * d
+    channels = (b, g, r) if bgr else (r, g, b)
+
+    image = np.stack(channels, axis=-1)
+    if np.issubdtype(y.dtype, np.integer):
+        image = np.round(image)
+    return np.clip(image, 0, 255).astype(y.dtype)
+
+
+def nv12_to_rgb_numpy(y, uv, bgr=False):
+    u = uv[..., 0].repeat(2, axis=1).repeat(2, axis=2)
+    v = uv[..., 1].repeat(2, axis=1).repeat(2, axis=2)
+    return yuv_to_rgb_numpy(y[..., 0], u, v, bgr)
+
+
+def i420_to_rgb_numpy(y, u, v, bgr=False):
+    u = u[..., 0].repeat(2, axis=1).repeat(2, axis=2)
+    v = v[..., 0].repeat(2, axis=1).repeat(2, axis=2)
+    return yuv_to_rgb_numpy(y[..., 0], u, v, bgr)
+
+
+@pytest.mark.parametrize("bgr", [False, True])
+def test_nv12_to_rgb_matches_numpy(bgr):
+    runtime = get_runtime()
+    data_y = np.random.randint(0, 256, size=[1, 4, 6, 1]).astype(np.uint8)
+    data_uv = np.random.randint(0, 256, size=[1, 2, 3, 2]).astype(np.uint8)
+
+    arg_y = ov.parameter(data_y.shape, name="input_y", dtype=np.uint8)
+    arg_uv = ov.parameter(data_uv.shape, name="input_uv", dtype=np.uint8)
+    node = ov.nv12_to_bgr(arg_y, arg_uv) if bgr else ov.nv12_to_rgb(arg_y, arg_uv)
+
+    computation = runtime.computation(node, arg_y, arg_uv)
+    result = computation(data_y, data_uv)[0]
+
+    assert np.allclose(result, nv12_to_rgb_numpy(data_y, data_uv, bgr), atol=1)
+
+
+@pytest.mark.parametrize("bgr", [False, True])
+def test_i420_to_rgb_matches_numpy(bgr):
+    runtime = get_runtime()
+    data_y = np.random.randint(0, 256, size=[1, 4, 6, 1]).astype(np.uint8)
+    data_u = np.random.randint(0, 256, size=[1, 2, 3, 1]).astype(np.uint8)
+    data_v = np.random.randint(0, 256, size=[1, 2, 3, 1]).astype(np.uint8)
+
+    arg_y = ov.parameter(data_y.shape, name="input_y", dtype=np.uint8)
+    arg_u = ov.parameter(data_u.shape, name="input_u", dtype=np.uint8)
+    arg_v = ov.parameter(data_v.shape, name="input_v", dtype=np.uint8)
+    node = ov.i420_to_bgr(arg_y, arg_u, arg_v) if bgr else ov.i420_to_rgb(arg_y, arg_u, arg_v)
+
+    computation = runtime.computation(node, arg_y, arg_u, arg_v)
+    result = computation(data_y, data_u, data_v)[0]
+
+    assert np.allclose(result, i420_to_rgb_numpy(data_y, data_u, data_v, bgr), atol=1)
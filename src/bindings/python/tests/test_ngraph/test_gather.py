@@ -3,6 +3,7 @@
 
 import openvino.runtime.opset8 as ov
 import numpy as np
+from openvino.runtime.opset8.ops import gather_cast
 
 from tests import xfail_issue_54630
 from tests.test_ngraph.util import run_op_node
@@ -23,6 +24,22 @@ def test_gather():
     assert np.allclose(result, expected)
 
 
+def test_gather_cast():
+    input_data = np.array(
+        [1.0, 1.1, 1.2, 2.0, 2.1, 2.2, 3.0, 3.1, 3.2], np.float32
+    ).reshape((3, 3))
+    input_indices = np.array([0, 2], np.int32).reshape(1, 2)
+    input_axis = np.array([1], np.int32)
+
+    expected = np.array([1.0, 1.2, 2.0, 2.2, 3.0, 3.2], dtype=np.float16).reshape(
+        (3, 1, 2)
+    )
+
+    result = run_op_node([input_data], gather_cast, input_indices, input_axis, np.float16)
+    assert result[0].dtype == np.float16
+    assert np.allclose(result, expected)
+
+
 def test_gather_with_scalar_axis():
     input_data = np.array(
         [1.0, 1.1, 1.2, 2.0, 2.1, 2.2, 3.0, 3.1, 3.2], np.float32
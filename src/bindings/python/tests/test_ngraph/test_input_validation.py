@@ -7,6 +7,7 @@ import pytest
 from openvino.runtime.exceptions import UserInputError
 from openvino.runtime.utils.input_validation import (
     _check_value,
+    check_non_negative_ints,
     check_valid_attribute,
     check_valid_attributes,
     is_non_negative_value,
@@ -39,6 +40,17 @@ def test_is_non_negative_value_unsigned_type(dtype):
     assert is_non_negative_value(dtype(0))
 
 
+@pytest.mark.parametrize("values", [[], [0, 1, 2], list(range(16)), np.arange(16), (1, 1, 1)])
+def test_check_non_negative_ints(values):
+    check_non_negative_ints("TestOp", "strides", values)
+
+
+@pytest.mark.parametrize("values", [[1, -1], list(range(-1, 15)), np.arange(-8, 8), [0] * 8 + [-0.5]])
+def test_check_non_negative_ints_invalid(values):
+    with pytest.raises(UserInputError):
+        check_non_negative_ints("TestOp", "strides", values)
+
+
 @pytest.mark.parametrize(
     "value, val_type",
     [
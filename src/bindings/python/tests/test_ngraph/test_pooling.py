@@ -5,6 +5,7 @@ import numpy as np
 import pytest
 
 import openvino.runtime.opset8 as ov
+from openvino.runtime.exceptions import UserInputError
 from tests.runtime import get_runtime
 
 
@@ -116,6 +117,20 @@ def test_max_pool_basic():
     assert np.allclose(result[1], expected_idx)
 
 
+def test_max_pool_repeated_attributes():
+    data_node = ov.parameter([1, 1, 4, 4], name="A", dtype=np.float32)
+
+    first = ov.max_pool(data_node, [1, 1], [1, 1], [0, 0], [0, 0], [2, 2])
+    second = ov.max_pool(data_node, np.array([1, 1]), [1, 1], [0, 0], [0, 0], [2, 2], "FLOOR", "explicit")
+
+    assert list(first.get_output_shape(0)) == [1, 1, 3, 3]
+    assert list(second.get_output_shape(0)) == [1, 1, 3, 3]
+    assert first.get_attributes() == second.get_attributes()
+
+    with pytest.raises(UserInputError):
+        ov.max_pool(data_node, [1, 1], [1, 1], [0, -1], [0, 0], [2, 2])
+
+
 def test_max_pool_strides():
     rt = get_runtime()
 
@@ -1,5 +1,7 @@
 import openvino.runtime.opset8 as ov
 import numpy as np
+import pytest
+from openvino.runtime import Type
 from tests.runtime import get_runtime
 
 
@@ -25,3 +27,20 @@ def test_random_uniform():
                                   [-1.4519991, -2.277353, 2.630727]]], dtype=np.float32)
 
     assert np.allclose(random_uniform_results, expected_results)
+
+
+@pytest.mark.parametrize("output_type, expected_type", [
+    ("f16", Type.f16),
+    ("f32", Type.f32),
+    ("i32", Type.i32),
+])
+def test_random_uniform_scalar_bounds(output_type, expected_type):
+    input_tensor = ov.constant(np.array([2, 4, 3], dtype=np.int32))
+
+    random_uniform_node = ov.random_uniform(input_tensor, 0, 10, output_type=output_type,
+                                            global_seed=7461, op_seed=1546)
+
+    assert random_uniform_node.get_output_element_type(0) == expected_type
+    assert random_uniform_node.input_value(1).get_element_type() == expected_type
+    assert random_uniform_node.input_value(2).get_element_type() == expected_type
+    assert list(random_uniform_node.get_output_shape(0)) == [2, 4, 3]